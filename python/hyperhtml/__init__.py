@@ -3,7 +3,8 @@
 Public API exports:
 - @component decorator and Component type (from hyperhtml.decorators)
 - HTML helpers (from hyperhtml.helpers)
-- Content collections (from hyperhtml.content, requires 'content' extra)
+- Content collections (from hyperhtml.content, requires 'content' extra, loaded on
+  first access)
 """
 
 # Components
@@ -25,7 +26,7 @@ from hyperhtml.helpers import (
 # Primary alias for transpiler - clear and readable
 escape = escape_html
 
-__all__ = [
+__all__ = (
     # Components
     "Component",
     "component",
@@ -41,29 +42,51 @@ __all__ = [
     "render_data",
     "render_aria",
     "spread_attrs",
-]
+)
+
+# Content collections (optional, requires 'content' extra). Imported on first
+# access: hyperhtml.content pulls in pydantic/msgspec when they're installed,
+# which templates that only render HTML should not pay for. They stay out of
+# `__all__` so a star-import never has to import them, or fail when the extra
+# is unusable.
+_CONTENT_EXPORTS = frozenset(
+    {
+        "Collection",
+        "MarkdownCollection",
+        "MarkdownSingleton",
+        "Singleton",
+        "computed",
+        "load",
+    }
+)
+
+
+def _content_installed() -> bool:
+    # hyperhtml.content needs the extra's `markdown`; find it without importing.
+    from importlib.util import find_spec
+
+    try:
+        return find_spec("markdown") is not None
+    except ValueError:  # an imported `markdown` whose __spec__ is None
+        return False
+
+
+def __getattr__(name: str):
+    if name in _CONTENT_EXPORTS:
+        try:
+            from hyperhtml import content
+        except ImportError as exc:
+            # Content extra not installed or not importable
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+
+        value = getattr(content, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Content collections (optional, requires 'content' extra)
-try:
-    from hyperhtml.content import (
-        Collection,
-        MarkdownCollection,
-        MarkdownSingleton,
-        Singleton,
-        computed,
-        load,
-    )
 
-    __all__.extend(
-        [
-            "Collection",
-            "MarkdownCollection",
-            "MarkdownSingleton",
-            "Singleton",
-            "computed",
-            "load",
-        ]
-    )
-except ImportError:
-    # Content extra not installed
-    pass
+def __dir__():
+    names = set(globals())
+    if _content_installed():
+        names.update(_CONTENT_EXPORTS)
+    return sorted(names)
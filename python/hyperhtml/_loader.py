@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.abc
 import importlib.machinery
+import importlib.util
+import marshal
+import os
 import sys
 import threading
 from pathlib import Path
-from types import ModuleType
+from types import CodeType, ModuleType
 from typing import Iterable
 
 
@@ -119,7 +123,7 @@ class HyperPackageLoader(importlib.abc.Loader):
 class HyperModuleLoader(importlib.abc.Loader):
     """Load one `.hyper` file as a normal Python module."""
 
-    def __init__(self, path: Path, code: str | None = None):
+    def __init__(self, path: Path, code: CodeType | None = None):
         self.path = path
         self.code = code
 
@@ -152,7 +156,13 @@ def _contains_hyper_file(path: Path) -> bool:
         return False
 
 
-def _compile_file(path: Path) -> tuple[str, str | None]:
+def _compile_file(path: Path) -> tuple[CodeType, str | None]:
+    """Transpile and compile `path`, reusing bytecode cached in `__pycache__`.
+
+    The cache key covers the template source, the compiler extension build, and
+    the interpreter's bytecode version, so editing the file, upgrading hyperhtml,
+    or switching Pythons all force a fresh compile.
+    """
     try:
         from hyperhtml import _native
     except Exception as exc:  # pragma: no cover - depends on wheel build health
@@ -163,6 +173,73 @@ def _compile_file(path: Path) -> tuple[str, str | None]:
 
     try:
         source = path.read_text()
-        return _native.transpile_file(source, str(path))
+        key = _cache_key(source)
+        cache_path = _cache_path(path)
+        cached = _read_cache(cache_path, key)
+        if cached is not None:
+            return cached
+        python_source, component_name = _native.transpile_file(source, str(path))
+        # Same filename `exec(str)` used before caching, since the generated
+        # line numbers don't map onto the `.hyper` file.
+        code = compile(python_source, "<string>", "exec")
     except Exception as exc:
         raise ImportError(f"Failed to compile {path}: {exc}") from exc
+
+    _write_cache(cache_path, key, code, component_name)
+    return code, component_name
+
+
+@functools.cache
+def _compiler_token() -> bytes:
+    """Identify the compiler build, so an upgraded wheel invalidates the cache."""
+    from hyperhtml import _native
+
+    stat = os.stat(_native.__file__)
+    return f"{stat.st_mtime_ns}:{stat.st_size}:{sys.flags.optimize}:".encode()
+
+
+def _cache_key(source: str) -> bytes:
+    token = _compiler_token() + source.encode()
+    return importlib.util.MAGIC_NUMBER + importlib.util.source_hash(token)
+
+
+def _cache_path(path: Path) -> Path | None:
+    # Name the cache as if the template were `<Name>.hyper.py`: CPython's own
+    # layout, including the `.opt-N` suffix and `sys.pycache_prefix`.
+    try:
+        return Path(importlib.util.cache_from_source(f"{path}.py"))
+    except NotImplementedError:  # sys.implementation.cache_tag is None
+        return None
+
+
+def _read_cache(cache_path: Path | None, key: bytes) -> tuple[CodeType, str | None] | None:
+    if cache_path is None:
+        return None
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    if not data.startswith(key):
+        return None
+    try:
+        code, component_name = marshal.loads(memoryview(data)[len(key) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return code, component_name
+
+
+def _write_cache(
+    cache_path: Path | None, key: bytes, code: CodeType, component_name: str | None
+) -> None:
+    if cache_path is None or sys.dont_write_bytecode:
+        return
+    data = key + marshal.dumps((code, component_name))
+    # Write then rename, so a concurrent reader never sees a partial file.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only trees just compile again on the next import.
+        tmp_path.unlink(missing_ok=True)
@@ -1,5 +1,6 @@
 """Markdown support for content collections."""
 
+import re
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Any
@@ -19,6 +20,13 @@ except ImportError:
     HAS_MSGSPEC = False
     msgspec = None
 
+# Compiled once at import; headings and slugs run for every loaded document.
+_ATX_HEADING = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#{1,6})?\s*$", re.MULTILINE)
+_MD_LINK = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_MD_EMPHASIS = re.compile(r"[*_~`]")
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[-\s]+")
+
 
 @dataclass
 class Heading:
@@ -86,12 +94,9 @@ class _MarkdownMixin:
     @cached_property
     def headings(self) -> list[Heading]:
         """Extract headings from markdown content."""
-        import re
-
         headings_list = []
-        atx_pattern = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#{1,6})?\s*$", re.MULTILINE)
 
-        for match in atx_pattern.finditer(self.body):
+        for match in _ATX_HEADING.finditer(self.body):
             level = len(match.group(1))
             text = match.group(2).strip()
             slug = _slugify(text)
@@ -107,16 +112,14 @@ class _MarkdownMixin:
 
 def _slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
-    import re
-
     # Remove markdown formatting
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)  # Links
-    text = re.sub(r"[*_~`]", "", text)  # Bold, italic, code
+    text = _MD_LINK.sub(r"\1", text)  # Links
+    text = _MD_EMPHASIS.sub("", text)  # Bold, italic, code
 
     # Convert to lowercase and replace spaces/special chars with hyphens
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_SEPARATORS.sub("-", text)
     text = text.strip("-")
 
     return text
@@ -5,6 +5,7 @@ from __future__ import annotations
 import functools
 import inspect
 from collections.abc import Callable, Iterable
+from types import FunctionType
 from typing import Any
 
 __all__ = ["Component", "HtmlResult", "component"]
@@ -28,22 +29,18 @@ class Component:
         *,
         subcomponents: Iterable[Component] = (),
     ) -> None:
-        signature = inspect.signature(render)
-        for parameter in signature.parameters.values():
-            if parameter.kind not in {
-                inspect.Parameter.KEYWORD_ONLY,
-                inspect.Parameter.VAR_KEYWORD,
-            }:
-                raise TypeError(
-                    f"{render.__name__} component parameters must be keyword-only"
-                )
+        if _accepts_positional(render):
+            raise TypeError(
+                f"{render.__name__} component parameters must be keyword-only"
+            )
 
         self.stream = render
         self._is_async = inspect.isasyncgenfunction(render)
         self._subcomponent_names = frozenset()
 
+        # inspect.signature() follows __wrapped__, so the signature is only
+        # built if someone asks for it.
         functools.update_wrapper(self, render, updated=())
-        self.__signature__ = signature
         self.__hyper__ = True
         self.do_not_call_in_templates = True
 
@@ -86,6 +83,22 @@ class Component:
         raise AttributeError(f"{component_name} has no component {name!r}") from None
 
 
+def _accepts_positional(render: Callable[..., Any]) -> bool:
+    """Whether `render` declares positional or `*args` parameters."""
+    # Plain functions answer from the code object. Building an inspect.Signature
+    # for every component shows up in import time on large apps.
+    overridden = hasattr(render, "__wrapped__") or hasattr(render, "__signature__")
+    if isinstance(render, FunctionType) and not overridden:
+        code = render.__code__
+        return code.co_argcount > 0 or bool(code.co_flags & inspect.CO_VARARGS)
+
+    return any(
+        parameter.kind
+        not in {inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.VAR_KEYWORD}
+        for parameter in inspect.signature(render).parameters.values()
+    )
+
+
 def component(
     render: Callable[..., Any] | None = None,
     *,
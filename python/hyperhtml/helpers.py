@@ -3,8 +3,6 @@
 These functions are used by compiled templates to safely render HTML.
 """
 
-import re
-
 try:
     from markupsafe._speedups import _escape_inner as _c_escape
 except ImportError:
@@ -83,6 +81,10 @@ def escape_html(value) -> str:
     """
     if type(value) is str:
         s = value
+    elif type(value) is int:
+        # Digits and a sign never need escaping (bool and int subclasses
+        # like IntEnum can render arbitrary text, so the check is exact).
+        return str(value)
     elif value is None:
         return ''
     elif hasattr(value, '__html__'):
@@ -93,6 +95,11 @@ def escape_html(value) -> str:
     if _c_escape is not None:
         return _c_escape(s)
 
+    # Most values contain nothing to escape. Membership tests are memchr-backed
+    # and allocate nothing, so check before running the replace chain.
+    if '&' not in s and '<' not in s and '>' not in s and '"' not in s and "'" not in s:
+        return s
+
     return (s
         .replace('&', '&amp;')
         .replace('<', '&lt;')
@@ -156,11 +163,18 @@ def render_class(*values) -> str:
         >>> render_class("btn", {"active": True}, ["lg"])
         'btn active lg'
     """
+    # Templates mostly pass one plain string: class="{cls}".
+    if len(values) == 1 and type(values[0]) is str:
+        return values[0]
+
     classes = []
-    queue = list(values)
+    # Depth-first via a reversed stack: popping from the end is O(1), where
+    # popping and prepending at the front of a list is O(n) per item.
+    stack = list(values)
+    stack.reverse()
 
-    while queue:
-        value = queue.pop(0)
+    while stack:
+        value = stack.pop()
         if not value:
             continue
         if isinstance(value, str):
@@ -168,7 +182,7 @@ def render_class(*values) -> str:
         elif isinstance(value, dict):
             classes.extend(k for k, v in value.items() if v)
         elif isinstance(value, (list, tuple)):
-            queue[0:0] = list(value)
+            stack.extend(reversed(value))
 
     return ' '.join(classes)
 
@@ -258,7 +272,7 @@ def render_aria(attrs: dict) -> str:
 def spread_attrs(attrs: dict) -> str:
     """Spread a dictionary as HTML attributes.
 
-    Each key-value pair is rendered as an attribute using render_attr().
+    Each key-value pair is rendered with the same rules as render_attr().
 
     Args:
         attrs: Dictionary of attribute names to values.
@@ -274,4 +288,11 @@ def spread_attrs(attrs: dict) -> str:
     """
     if not attrs:
         return ''
-    return ''.join(render_attr(k, v) for k, v in attrs.items())
+    # render_attr's rules, inlined: a call per key costs more than the work.
+    parts = []
+    for k, v in attrs.items():
+        if v is True:
+            parts.append(f' {k}')
+        elif v is not False and v is not None:
+            parts.append(f' {k}="{escape_html(v)}"')
+    return ''.join(parts)
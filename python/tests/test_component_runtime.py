@@ -31,6 +31,28 @@ def test_component_decorator_rejects_positional_parameters():
             yield f"<p>Hello {name}</p>"
 
 
+def test_component_decorator_rejects_star_args_and_wrapped_positionals():
+    import functools
+
+    from hyperhtml import component
+
+    with pytest.raises(TypeError, match="keyword-only"):
+
+        @component
+        def Greeting(*names: str):
+            yield from names
+
+    def render(name: str):
+        yield f"<p>Hello {name}</p>"
+
+    @functools.wraps(render)
+    def wrapper(*args, **kwargs):
+        yield from render(*args, **kwargs)
+
+    with pytest.raises(TypeError, match="keyword-only"):
+        component(wrapper)
+
+
 def test_subcomponents_are_named_read_only_component_attributes():
     from hyperhtml import component
 
@@ -1,7 +1,8 @@
-"""Escape contract. Output must be identical whether the C fast path or the
-pure-Python fallback runs, so these lock the exact bytes."""
+"""Escape contract, plus class and spread attribute rendering. Escaped output
+must be identical whether the C fast path or the pure-Python fallback runs,
+so these lock the exact bytes."""
 
-from hyperhtml.helpers import escape_html, safe
+from hyperhtml.helpers import escape_html, render_attr, render_class, safe, spread_attrs
 
 
 def test_escapes_all_five_special_chars():
@@ -14,12 +15,43 @@ def test_none_renders_empty():
 
 def test_non_str_is_stringified_then_escaped():
     assert escape_html(42) == '42'
+    assert escape_html(-7) == '-7'
     assert escape_html(3 < 5) == 'True'
 
 
+def test_int_subclass_str_is_still_escaped():
+    class Flag(int):
+        def __str__(self):
+            return '<on>'
+
+    assert escape_html(Flag(1)) == '&lt;on&gt;'
+
+
 def test_safe_value_passes_through_unescaped():
     assert escape_html(safe('<b>bold</b>')) == '<b>bold</b>'
 
 
 def test_clean_string_is_unchanged():
     assert escape_html('no specials here') == 'no specials here'
+
+
+def test_pure_python_fallback_matches_c_fast_path(monkeypatch):
+    from hyperhtml import helpers
+
+    monkeypatch.setattr(helpers, '_c_escape', None)
+    assert escape_html('<a>&"\'') == '&lt;a&gt;&amp;&#34;&#39;'
+    assert escape_html('no specials here') == 'no specials here'
+    assert escape_html(42) == '42'
+
+
+def test_render_class_flattens_in_source_order():
+    assert render_class('btn') == 'btn'
+    assert render_class(
+        'a', ['b', ('c', {'d': True, 'x': False})], None, {'e': 1}, 'f'
+    ) == 'a b c d e f'
+
+
+def test_spread_attrs_matches_render_attr():
+    attrs = {'id': 'a&b', 'disabled': True, 'hidden': False, 'title': None, 'tabindex': 0}
+    assert spread_attrs(attrs) == ''.join(render_attr(k, v) for k, v in attrs.items())
+    assert spread_attrs(attrs) == ' id="a&amp;b" disabled tabindex="0"'
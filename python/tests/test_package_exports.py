@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+
+def run_python(code: str) -> None:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_content_exports_are_imported_lazily():
+    """`import hyperhtml` defers hyperhtml.content until a content name is used."""
+    run_python(
+        "import sys, hyperhtml\n"
+        "assert 'hyperhtml.content' not in sys.modules\n"
+        "from hyperhtml import load\n"
+        "from hyperhtml.content import load as content_load\n"
+        "assert load is content_load\n"
+    )
+
+
+def test_star_import_exports_core_names_without_importing_content():
+    run_python(
+        "import sys\n"
+        "from hyperhtml import *\n"
+        "assert component and escape and render_class\n"
+        "assert 'load' not in globals()\n"
+        "assert 'hyperhtml.content' not in sys.modules\n"
+    )
+
+
+def test_dir_does_not_import_content():
+    run_python(
+        "import sys, hyperhtml\n"
+        "assert 'load' in dir(hyperhtml)\n"
+        "assert 'hyperhtml.content' not in sys.modules\n"
+    )
+
+
+def test_content_exports_are_absent_without_content_extra():
+    run_python(
+        "import inspect, sys\n"
+        "sys.modules['markdown'] = None\n"
+        "import hyperhtml\n"
+        "assert hasattr(hyperhtml, 'load') is False\n"
+        "assert 'load' not in dir(hyperhtml)\n"
+        "assert 'component' in dict(inspect.getmembers(hyperhtml))\n"
+    )
+
+
+def test_star_import_skips_content_exports_without_content_extra():
+    run_python(
+        "import sys\n"
+        "sys.modules['markdown'] = None\n"
+        "from hyperhtml import *\n"
+        "assert component and escape\n"
+        "assert 'load' not in globals()\n"
+    )
+
+
+def test_broken_content_package_does_not_break_star_import():
+    run_python(
+        "import inspect, sys\n"
+        "import markdown\n"
+        "sys.modules['hyperhtml.content.loader'] = None\n"
+        "import hyperhtml\n"
+        "from hyperhtml import *\n"
+        "assert component\n"
+        "assert hasattr(hyperhtml, 'load') is False\n"
+        "assert 'component' in dict(inspect.getmembers(hyperhtml))\n"
+    )
@@ -81,3 +81,54 @@ name: str
     from app.components import Card
 
     assert Card(name="Ada") == "<div><span>Hello Ada</span></div>"
+
+
+def test_compiled_bytecode_is_cached_and_invalidated_on_edit(tmp_path, monkeypatch):
+    from hyperhtml import _native
+
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    source = tmp_path / "app" / "components" / "Greeting.hyper"
+    write(source, "name: str\n---\n<p>Hello {name}</p>\n")
+
+    from app.components import Greeting
+
+    assert Greeting(name="Ada") == "<p>Hello Ada</p>"
+    assert list(source.parent.glob("__pycache__/Greeting.hyper.*.pyc"))
+
+    def fail(*args):
+        raise AssertionError("template was transpiled again")
+
+    sys.modules.pop("app.components")
+    with monkeypatch.context() as patch:
+        patch.setattr(_native, "transpile_file", fail)
+        from app.components import Greeting
+
+    assert Greeting(name="Ada") == "<p>Hello Ada</p>"
+
+    write(source, "name: str\n---\n<p>Hi {name}</p>\n")
+    sys.modules.pop("app.components")
+    from app.components import Greeting
+
+    assert Greeting(name="Ada") == "<p>Hi Ada</p>"
+
+
+def test_bytecode_cache_file_follows_cpython_layout(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from hyperhtml._loader import _cache_path
+
+    source = tmp_path / "Greeting.hyper"
+    tag = sys.implementation.cache_tag
+    monkeypatch.setattr(sys, "pycache_prefix", None)
+
+    monkeypatch.setattr(sys, "flags", SimpleNamespace(optimize=0))
+    assert _cache_path(source) == tmp_path / "__pycache__" / f"Greeting.hyper.{tag}.pyc"
+    monkeypatch.setattr(sys, "flags", SimpleNamespace(optimize=2))
+    assert _cache_path(source).name == f"Greeting.hyper.{tag}.opt-2.pyc"
+
+    prefix = tmp_path / "prefix"
+    monkeypatch.setattr(sys, "pycache_prefix", str(prefix))
+    cache_path = _cache_path(source)
+    assert cache_path.is_relative_to(prefix)
+    assert "__pycache__" not in cache_path.parts